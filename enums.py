@@ -23,4 +23,8 @@ comparison_operators = (
     "IS_SUPERSET_OF",
 )
 
-ref_types = ("schema", "party", "object_type", "object_promise", "action", "checkpoint", "thread_group")
\ No newline at end of file
+ref_types = ("schema", "party", "object_type", "object_promise", "action", "checkpoint", "thread_group")
+
+# hashed lookups for membership checks (the tuples above preserve order for error messages)
+valid_list_item_types_set = frozenset(valid_list_item_types)
+ref_types_set = frozenset(ref_types)
@@ -1,32 +1,36 @@
+import functools
 import json
 import math
 import requests
+import time
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# upper bound on concurrent requests made by the batch creation methods
+_default_max_workers = 8
 
 
 class MiroBoard:
     def __init__(self, board_id=None):
         self.board_id = board_id
-        self.access_token = json.load(open("tokens.json"))["access_token"]
+        self.access_token = _load_access_token()
+
+    @property
+    def board_id(self):
+        return self._board_id
+
+    @board_id.setter
+    def board_id(self, board_id):
+        # the per-board endpoints are built once here instead of on every request
+        self._board_id = board_id
+        self._shapes_url = f"{_boards_url}/{board_id}/shapes"
+        self._connectors_url = f"{_boards_url}/{board_id}/connectors"
 
     def create(self, board_name):
-        url = "https://api.miro.com/v2/boards"
+        url = _boards_url
 
-        payload = {
-            "name": board_name,
-            "policy": {
-                "permissionsPolicy": {
-                    "collaborationToolsStartAccess": "all_editors",
-                    "copyAccess": "anyone",
-                    "sharingAccess": "team_members_with_editing_rights",
-                },
-                "sharingPolicy": {
-                    "access": "private",
-                    "inviteToAccountAndBoardLinkAccess": "no_access",
-                    "organizationAccess": "private",
-                    "teamAccess": "private",
-                },
-            },
-        }
+        payload = {"name": board_name, "policy": _board_policy}
 
         self.board_id = self._miro_api_request(url, payload)
 
@@ -41,9 +45,8 @@ class MiroBoard:
     ):
         self._check_board_id()
 
-        url = f"https://api.miro.com/v2/boards/{self.board_id}/shapes"
+        url = self._shapes_url
 
-        content_length = len(str(content))
         payload = {
             "data": {"shape": shape_type, "content": content},
             "style": {
@@ -54,10 +57,11 @@ class MiroBoard:
                 "textAlignVertical": "middle",
             },
             "position": {"origin": "center", "x": x, "y": y},
-            "geometry": {
-                "width": 100 if content_length < 36 else 150,
-                "height": 100 if content_length < 36 else 120,
-            },
+            "geometry": (
+                _small_shape_geometry
+                if len(str(content)) < 36
+                else _large_shape_geometry
+            ),
         }
 
         return self._miro_api_request(url, payload)
@@ -69,21 +73,13 @@ class MiroBoard:
     ):
         self._check_board_id()
 
-        url = f"https://api.miro.com/v2/boards/{self.board_id}/shapes"
+        url = self._shapes_url
 
         payload = {
             "data": {"shape": "circle"},
-            "style": {
-                "fillOpacity": "0",
-                "borderWidth": "1",
-                "borderOpacity": "0",
-                "color": "#ffffff",
-            },
+            "style": _invisible_shape_style,
             "position": {"origin": "center", "x": x, "y": y},
-            "geometry": {
-                "width": 8,
-                "height": 8,
-            },
+            "geometry": _invisible_shape_geometry,
         }
 
         return self._miro_api_request(url, payload)
@@ -99,7 +95,7 @@ class MiroBoard:
     ):
         self._check_board_id()
 
-        url = f"https://api.miro.com/v2/boards/{self.board_id}/connectors"
+        url = self._connectors_url
 
         payload = {
             "startItem": {"id": from_id, "snapTo": "left"},
@@ -122,10 +118,32 @@ class MiroBoard:
 
         return self._miro_api_request(url, payload)
 
+    def create_shapes(self, shape_specs, max_workers=_default_max_workers):
+        """Creates shapes concurrently, where each spec is a dict of
+        create_shape keyword arguments. Returns the shape ids in spec order.
+        """
+        return self._create_concurrently(self.create_shape, shape_specs, max_workers)
+
+    def create_invisible_shapes(self, shape_specs, max_workers=_default_max_workers):
+        """Creates invisible shapes concurrently, where each spec is a dict of
+        create_invisible_shape keyword arguments. Returns the shape ids in spec order.
+        """
+        return self._create_concurrently(
+            self.create_invisible_shape, shape_specs, max_workers
+        )
+
+    def create_connectors(self, connector_specs, max_workers=_default_max_workers):
+        """Creates connectors concurrently, where each spec is a dict of
+        create_connector keyword arguments. Returns the connector ids in spec order.
+        """
+        return self._create_concurrently(
+            self.create_connector, connector_specs, max_workers
+        )
+
     def delete_shape(self, shape_id):
         self._check_board_id()
 
-        url = f"https://api.miro.com/v2/boards/{self.board_id}/shapes/{shape_id}"
+        url = f"{self._shapes_url}/{shape_id}"
 
         return self._miro_api_request(url, None, request_type="DELETE")
 
@@ -137,17 +155,109 @@ class MiroBoard:
 
         if request_type == "POST":
             headers["content-type"] = "application/json"
-            response = json.loads(
-                requests.post(url, json=payload, headers=headers).text
-            )
-        elif request_type == "DELETE":
-            response = json.loads(requests.delete(url, headers=headers).text)
+
+        # a rate-limited request was not processed, so it is safe to resend it
+        for attempt in range(_max_rate_limit_retries + 1):
+            if request_type == "POST":
+                raw_response = _session.post(
+                    url, json=payload, headers=headers, timeout=_request_timeout
+                )
+            elif request_type == "DELETE":
+                raw_response = _session.delete(
+                    url, headers=headers, timeout=_request_timeout
+                )
+
+            if raw_response.status_code != 429 or attempt == _max_rate_limit_retries:
+                break
+
+            time.sleep(_rate_limit_delay(raw_response, attempt))
+
+        response = raw_response.json()
 
         if "type" in response and response["type"] == "error":
             raise Exception(response["message"])
 
         return response["id"]
 
+    def _create_concurrently(self, create_fn, specs, max_workers):
+        self._check_board_id()
+
+        if not specs:
+            return []
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda spec: create_fn(**spec), specs))
+
     def _check_board_id(self):
         if self.board_id is None:
             raise Exception("Cannot create shape: board_id is None")
+
+
+def _rate_limit_delay(response, attempt):
+    # prefer the server's Retry-After hint, falling back to exponential backoff
+    try:
+        return float(response.headers["Retry-After"])
+    except (KeyError, ValueError):
+        return _rate_limit_backoff * 2**attempt
+
+
+# reuse connections across API requests. Only failures to establish a connection
+# are retried: read errors and error statuses are not, since a request that reached
+# the server may already have created an item.
+_session = requests.Session()
+_session.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=10,
+        max_retries=Retry(
+            total=3,
+            connect=3,
+            read=0,
+            status=0,
+            respect_retry_after_header=False,
+            backoff_factor=0.2,
+        ),
+    ),
+)
+# seconds to wait for the Miro API to connect or respond,
+# so that a stalled request cannot block a batch indefinitely
+_request_timeout = 10
+# how often, and after how many seconds initially, a rate-limited (HTTP 429)
+# request is resent before its error is raised
+_max_rate_limit_retries = 5
+_rate_limit_backoff = 1
+
+
+@functools.lru_cache(maxsize=None)
+def _load_access_token():
+    # read lazily and only once, so importing this module does not require tokens.json
+    with open("tokens.json") as f:
+        return json.load(f)["access_token"]
+
+
+_boards_url = "https://api.miro.com/v2/boards"
+
+# static payload fragments; these are shared between requests and must not be mutated
+_board_policy = {
+    "permissionsPolicy": {
+        "collaborationToolsStartAccess": "all_editors",
+        "copyAccess": "anyone",
+        "sharingAccess": "team_members_with_editing_rights",
+    },
+    "sharingPolicy": {
+        "access": "private",
+        "inviteToAccountAndBoardLinkAccess": "no_access",
+        "organizationAccess": "private",
+        "teamAccess": "private",
+    },
+}
+_invisible_shape_style = {
+    "fillOpacity": "0",
+    "borderWidth": "1",
+    "borderOpacity": "0",
+    "color": "#ffffff",
+}
+_invisible_shape_geometry = {"width": 8, "height": 8}
+_small_shape_geometry = {"width": 100, "height": 100}
+_large_shape_geometry = {"width": 150, "height": 120}
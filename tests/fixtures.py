@@ -2,9 +2,8 @@ def basic_schema_with_actions(num_actions):
     schema = basic_schema()
     schema["parties"].append({"id": 0, "name": "Project"})
 
-    for i in range(num_actions):
-        schema["actions"].append(action(i))
-        schema["object_promises"].append(object_promise(i))
+    schema["actions"] = [action(i) for i in range(num_actions)]
+    schema["object_promises"] = [object_promise(i) for i in range(num_actions)]
 
     return schema
 
@@ -61,8 +60,8 @@ def action(action_id=None):
 
     return {
         "id": action_id,
-        "name": "action_" + str(action_id),
-        "object_promise": "object_promise:" + str(action_id),
+        "name": f"action_{action_id}",
+        "object_promise": f"object_promise:{action_id}",
         "description": "test action",
         "party": "party:{Project}",
         "operation": {
@@ -74,21 +73,19 @@ def action(action_id=None):
 def object_promise(op_id=0, object_type="Placeholder"):
     return {
         "id": op_id,
-        "name": "object_promise_" + str(op_id),
-        "object_type": "object_type:{" + object_type + "}",
+        "name": f"object_promise_{op_id}",
+        "object_type": f"object_type:{{{object_type}}}",
     }
 
 
 def checkpoint(id, alias, gate_type="AND", num_dependencies=2):
-    dependencies = []
-    for i in range(num_dependencies):
-        dependencies.append(dependency(ref="action:" + str(i)))
-
     checkpoint = {
         "id": id,
         "alias": alias,
         "description": "test dependency set",
-        "dependencies": dependencies,
+        "dependencies": [
+            dependency(ref=f"action:{i}") for i in range(num_dependencies)
+        ],
     }
 
     if num_dependencies > 1:
@@ -115,7 +112,7 @@ def dependency(
 def thread_group(id, depends_on_id=None):
     thread = {
         "id": id,
-        "name": "thread_group_" + str(id),
+        "name": f"thread_group_{id}",
         "description": "",
         "spawn": {
             "foreach": "object_promise:0.numbers",
@@ -124,6 +121,6 @@ def thread_group(id, depends_on_id=None):
     }
 
     if depends_on_id is not None:
-        thread["depends_on"] = "checkpoint:{" + depends_on_id + "}"
+        thread["depends_on"] = f"checkpoint:{{{depends_on_id}}}"
 
     return thread
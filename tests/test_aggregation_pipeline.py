@@ -1638,3 +1638,66 @@ class TestAggregationPipeline:
         schema["pipelines"][1]["apply"][0]["from"] = "object_promise:2.number"
         errors = validator.validate(json_string=json.dumps(schema))
         assert not errors
+
+    def test_non_string_variable_type(self):
+        # unhashable variable types should be reported as invalid, not raise
+        validator = SchemaValidator()
+        schema = fixtures.basic_schema_with_actions(3)
+        schema["checkpoints"] = [
+            fixtures.checkpoint(id=0, alias="depends-on-0", num_dependencies=1),
+        ]
+        schema["actions"][1]["depends_on"] = "checkpoint:{depends-on-0}"
+        schema["pipelines"].append(
+            {
+                "id": 0,
+                "name": "pipeline_0",
+                "object_promise": "object_promise:1",
+                "context": "TEMPLATE",
+                "variables": [
+                    {
+                        "name": "$some_var",
+                        "type": ["NUMERIC"],
+                        "initial": None,
+                    },
+                    {
+                        "name": "$output_var",
+                        "type": "NUMERIC",
+                        "initial": 0,
+                    },
+                ],
+                "output": [
+                    {
+                        "from": "$output_var",
+                        "to": "number",
+                    }
+                ],
+            }
+        )
+        errors = validator.validate(json_string=json.dumps(schema))
+        assert len(errors) == 1
+        assert errors[0].startswith(
+            "root.pipelines[0].variables[0].type: invalid enum value"
+        )
+
+        schema["pipelines"][0]["variables"][0]["type"] = "NUMERIC"
+        schema["pipelines"][0]["traverse"] = [
+            {
+                "ref": "object_promise:0.objects",
+                "foreach": {
+                    "as": "$edge",
+                    "variables": [
+                        {
+                            "name": "$average",
+                            "type": {"a": 1},
+                            "initial": None,
+                        },
+                    ],
+                    "apply": [],
+                },
+            },
+        ]
+        errors = validator.validate(json_string=json.dumps(schema))
+        assert len(errors) == 1
+        assert errors[0].startswith(
+            "root.pipelines[0].traverse[0].foreach.variables[0].type: invalid enum value"
+        )
@@ -1,4 +1,11 @@
+import random
+import threading
+import time
+import pytest
+from services import miro
+from services.miro import MiroBoard
 from visualization.dependency_graph import DependencyGraph
+from visualization.dependency_chart_layout import DependencyChartLayout
 
 
 class TestDependencyGraph:
@@ -247,3 +254,186 @@ class TestDependencyGraph:
             ("3 and 4", "4"),
         ]
         assert graph.edge_tuples == expected_edge_tuples
+
+    def test_cyclic_dependency_layout(self):
+        # a cycle should be reported rather than traversed indefinitely
+        node_ids = ["C", "A", "B"]
+        edge_dict = {"C": ["A"], "A": ["B"], "B": ["A"]}
+        edge_tuples = [("C", "A"), ("A", "B"), ("B", "A")]
+
+        with pytest.raises(Exception, match="cyclic dependency"):
+            DependencyChartLayout().from_graph_data(node_ids, edge_dict, edge_tuples)
+
+    def test_miro_batch_creation_order(self, monkeypatch):
+        connectors = _stub_miro_requests(monkeypatch)
+        mb = MiroBoard(board_id="test_board")
+
+        # results must follow spec order, regardless of completion order
+        shape_ids = mb.create_shapes([{"content": str(i)} for i in range(20)])
+        assert shape_ids == [f"shape:{i}" for i in range(20)]
+
+        elbow_ids = mb.create_invisible_shapes([{"x": i, "y": 0} for i in range(20)])
+        assert elbow_ids == [f"elbow:{i},0" for i in range(20)]
+
+        connector_ids = mb.create_connectors(
+            [{"from_id": str(i), "to_id": str(i + 1)} for i in range(20)]
+        )
+        assert connector_ids == [f"connector:{i}->{i + 1}" for i in range(20)]
+        assert len(connectors) == 20
+
+        assert mb.create_shapes([]) == []
+
+    def test_miro_rate_limit_retry(self, monkeypatch):
+        class StubResponse:
+            def __init__(self, status_code, body, headers=None):
+                self.status_code = status_code
+                self.headers = headers or {}
+                self._body = body
+
+            def json(self):
+                return self._body
+
+        rate_limited = {"type": "error", "message": "Too many requests"}
+        responses = [
+            StubResponse(429, rate_limited, {"Retry-After": "2"}),
+            StubResponse(429, rate_limited),
+            StubResponse(201, {"id": "shape_id"}),
+        ]
+        sleeps = []
+
+        monkeypatch.setattr(miro, "_load_access_token", lambda: "test_token")
+        monkeypatch.setattr(
+            miro._session, "post", lambda *args, **kwargs: responses.pop(0)
+        )
+        monkeypatch.setattr(miro.time, "sleep", sleeps.append)
+        mb = MiroBoard(board_id="test_board")
+
+        # rate-limited requests are resent, honouring Retry-After when present
+        assert mb.create_shape(content="shape") == "shape_id"
+        assert sleeps == [2.0, miro._rate_limit_backoff * 2]
+
+        # the error is raised once the retries are exhausted
+        responses.extend(
+            StubResponse(429, rate_limited)
+            for _ in range(miro._max_rate_limit_retries + 1)
+        )
+        with pytest.raises(Exception, match="Too many requests"):
+            mb.create_shape(content="shape")
+        assert not responses
+
+    def test_generate_miro_shapes_and_connectors(self, monkeypatch):
+        connectors = _stub_miro_requests(monkeypatch)
+        mb = MiroBoard(board_id="test_board")
+
+        graph = DependencyGraph(
+            json_schema_file_path="schemas/test/multi_condition_node_dependency.json",
+            validate_schema=False,
+        )
+        graph.actions["0"]["supporting_info"] = ["supporting info"]
+
+        # supporting info shapes are created, but are not mapped to a node
+        shape_dict = graph._generate_miro_shapes(mb)
+        assert shape_dict == {
+            "0": "shape:Node 0",
+            "1": "shape:Node 1",
+            "a#0000": "shape:AND",
+        }
+
+        graph._generate_miro_connectors(mb, shape_dict)
+
+        # the two dependencies from the gate to node "0" are split into strands,
+        # each connecting from -> elbow -> to
+        gate_shape_id = shape_dict["a#0000"]
+        node_shape_id = shape_dict["0"]
+        elbow_ids = sorted(
+            {
+                connector["to_id"]
+                for connector in connectors
+                if connector["to_id"].startswith("elbow:")
+            },
+            key=lambda elbow_id: float(elbow_id.split(",")[1]),
+        )
+        assert len(elbow_ids) == 2
+
+        # the strands are drawn once per occurrence of the edge tuple
+        num_occurences = graph.edge_tuples.count(("a#0000", "0"))
+        captions = graph.edge_captions[("a#0000", "0")]
+        for i, elbow_id in enumerate(elbow_ids):
+            into_elbow = [c for c in connectors if c["to_id"] == elbow_id]
+            out_of_elbow = [c for c in connectors if c["from_id"] == elbow_id]
+            assert (
+                into_elbow
+                == [
+                    {
+                        "from_id": gate_shape_id,
+                        "to_id": elbow_id,
+                        "end_stroke_cap": "none",
+                        "caption": captions[i] if i % 2 == 0 else None,
+                    }
+                ]
+                * num_occurences
+            )
+            assert (
+                out_of_elbow
+                == [
+                    {
+                        "from_id": elbow_id,
+                        "to_id": node_shape_id,
+                        "end_stroke_cap": "arrow",
+                        "caption": captions[i] if i % 2 == 1 else None,
+                    }
+                ]
+                * num_occurences
+            )
+
+        # the single dependency is connected directly
+        assert {
+            "from_id": shape_dict["1"],
+            "to_id": gate_shape_id,
+            "end_stroke_cap": "arrow",
+            "caption": graph.edge_captions[("1", "a#0000")][0],
+        } in connectors
+        assert len(connectors) == 1 + 2 * len(elbow_ids) * num_occurences
+
+
+def _stub_miro_requests(monkeypatch):
+    """Replaces the single-item MiroBoard request methods with stubs that derive ids
+    from their arguments, returning the list of created connectors.
+    """
+
+    connectors = []
+    lock = threading.Lock()
+
+    def delay():
+        # vary completion order across worker threads
+        time.sleep(random.random() / 1000)
+
+    def create_shape(self, content="", **kwargs):
+        delay()
+        return f"shape:{content}"
+
+    def create_invisible_shape(self, x=0, y=0):
+        delay()
+        return f"elbow:{x},{y}"
+
+    def create_connector(
+        self, from_id, to_id, end_stroke_cap="arrow", caption=None, **kwargs
+    ):
+        delay()
+        with lock:
+            connectors.append(
+                {
+                    "from_id": from_id,
+                    "to_id": to_id,
+                    "end_stroke_cap": end_stroke_cap,
+                    "caption": caption,
+                }
+            )
+        return f"connector:{from_id}->{to_id}"
+
+    monkeypatch.setattr(miro, "_load_access_token", lambda: "test_token")
+    monkeypatch.setattr(MiroBoard, "create_shape", create_shape)
+    monkeypatch.setattr(MiroBoard, "create_invisible_shape", create_invisible_shape)
+    monkeypatch.setattr(MiroBoard, "create_connector", create_connector)
+
+    return connectors
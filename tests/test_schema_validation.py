@@ -2133,3 +2133,75 @@ class TestSchemaValidation:
         for valid_boolean in valid_booleans:
             errors = validator._validate_boolean("none", valid_boolean, obj_spec)
             assert not errors
+
+    def test_validator_reuse(self):
+        validator = SchemaValidator()
+
+        errors = validator.validate(
+            json_file_path="schemas/test/small_example_schema.json"
+        )
+        assert not errors
+        assert validator._pipelines
+
+        # state collected for the previous schema should not carry over
+        errors = validator.validate(
+            json_string=json.dumps(fixtures.basic_schema_with_actions(1))
+        )
+        assert not errors
+        assert not validator._pipelines
+        assert not validator._type_details_at_path
+
+        schema = fixtures.basic_schema_with_actions(1)
+        schema["standard"] = 1
+        errors = validator.validate(json_string=json.dumps(schema))
+        assert errors
+
+        validator.reset()
+        assert not validator.errors
+        assert not validator.warnings
+
+        # a schema that is not an object skips action and checkpoint collection,
+        # so the state collected there must be cleared by reset() as well
+        errors = validator.validate(
+            json_file_path="schemas/test/small_example_schema.json"
+        )
+        assert not errors
+        assert validator._object_promise_actions
+
+        errors = validator.validate(json_string="[]")
+        assert errors
+        assert not validator._object_promise_actions
+        assert not validator._thread_group_checkpoint_references
+        assert not validator._checkpoints
+
+    def test_has_ancestor_from_ancestor_refs(self):
+        # action 3 depends on action 2, which depends on action 1
+        schema = fixtures.basic_schema_with_actions(4)
+        schema["checkpoints"] = [
+            fixtures.checkpoint(0, "depends-on-1", num_dependencies=1),
+            fixtures.checkpoint(1, "depends-on-2", num_dependencies=1),
+        ]
+        schema["checkpoints"][0]["dependencies"][0]["compare"]["left"][
+            "ref"
+        ] = "action:1.object_promise.completed"
+        schema["checkpoints"][1]["dependencies"][0]["compare"]["left"][
+            "ref"
+        ] = "action:2.object_promise.completed"
+        schema["actions"][2]["depends_on"] = "checkpoint:{depends-on-1}"
+        schema["actions"][3]["depends_on"] = "checkpoint:{depends-on-2}"
+
+        validator = SchemaValidator()
+        errors = validator.validate(json_string=json.dumps(schema))
+        assert not errors
+
+        # checkpoints visited while checking a non-ancestor candidate
+        # must not be skipped when checking the next candidate
+        errors = validator.validate_has_ancestor(
+            "root", "action:3", ancestor_refs=["action:3", "action:0", "action:1"]
+        )
+        assert not errors
+
+        errors = validator.validate_has_ancestor(
+            "root", "action:3", ancestor_refs=["action:3", "action:0"]
+        )
+        assert len(errors) == 1
@@ -11,17 +11,26 @@ def hash_sorted_object(obj):
 
 
 def recursive_sort(obj):
-    if isinstance(obj, dict):
-        return sorted((k, recursive_sort(_normalize_type(v))) for k, v in obj.items())
-    if isinstance(obj, list):
-        return sorted(recursive_sort(_normalize_type(x)) for x in obj)
-    else:
-        return obj
+    sort_fn = _sort_fns.get(type(obj))
+    return sort_fn(obj) if sort_fn is not None else obj
 
 
-def _normalize_type(value):
-    if isinstance(value, dict) or isinstance(value, list):
-        return value
+def _sort_dict(obj):
+    return sorted((k, _sort_value(v)) for k, v in obj.items())
 
-    # enables comparison between different types when sorting
-    return str(value)
+
+def _sort_list(obj):
+    return sorted(_sort_value(x) for x in obj)
+
+
+def _sort_value(value):
+    sort_fn = _sort_fns.get(type(value))
+    if sort_fn is None:
+        # leaf value: stringify to enable comparison between different types when sorting
+        return str(value)
+
+    return sort_fn(value)
+
+
+# dispatch on the exact type, since parsed JSON only contains plain dicts and lists
+_sort_fns = {dict: _sort_dict, list: _sort_list}
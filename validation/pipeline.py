@@ -1,4 +1,6 @@
 class Pipeline:
+    __slots__ = ("object_promise_ref", "thread_group_ref", "thread_scope", "variables")
+
     def __init__(self, object_promise_ref, thread_group_ref, thread_scope):
         self.object_promise_ref = object_promise_ref
         self.thread_group_ref = thread_group_ref
@@ -1,7 +1,7 @@
 import json
 from validation import utils
 from validation.type_details import TypeDetails
-from enums import valid_list_item_types
+from enums import valid_list_item_types, valid_list_item_types_set
 
 
 def validate_operation(
@@ -27,42 +27,10 @@ def validate_operation(
             'the "SET" method can only be used for the first operation on a variable'
         )
 
-    # {left_operand_type: {right_operand_type: [methods]}}
-    valid_methods = {
-        "STRING": {"STRING": ["CONCAT"]},
-        "NUMERIC": {"NUMERIC": ["ADD", "SUBTRACT", "MULTIPLY", "DIVIDE"]},
-        "BOOLEAN": {"BOOLEAN": ["AND", "OR"]},
-        "NUMERIC_LIST": {
-            "NUMERIC_LIST": ["CONCAT"],
-            "NUMERIC": ["APPEND", "PREPEND"],
-        },
-        "STRING_LIST": {
-            "STRING_LIST": ["CONCAT"],
-            "STRING": ["APPEND", "PREPEND"],
-        },
-        "BOOLEAN_LIST": {
-            "BOOLEAN_LIST": ["CONCAT"],
-            "BOOLEAN": ["APPEND", "PREPEND"],
-        },
-        "NULL": {
-            "OBJECT": ["SET"],
-            "STRING": ["SET"],
-            "NUMERIC": ["SET"],
-            "BOOLEAN": ["SET"],
-            "STRING_LIST": ["SET"],
-            "NUMERIC_LIST": ["SET"],
-        },
-        "OBJECT": {"OBJECT": ["SET"]},
-        "OBJECT_LIST": {
-            "OBJECT_LIST": ["SET", "CONCAT"],
-            "OBJECT": ["APPEND", "PREPEND"],
-        },
-    }
-
     if (
-        l not in valid_methods
-        or r not in valid_methods[l]
-        or method not in valid_methods[l][r]
+        l not in _valid_methods
+        or r not in _valid_methods[l]
+        or method not in _valid_methods[l][r]
     ):
         raise Exception(
             f"invalid method for operand types {json.dumps(l)} and {json.dumps(r)}: {json.dumps(method)}"
@@ -103,29 +71,16 @@ def determine_right_operand_type(
         if not field_type_to_aggregate.is_list:
             raise Exception("cannot aggregate non-list type")
 
-        compatible_operators = {
-            "BOOLEAN": ["AND", "OR", "COUNT"],
-            "STRING": ["FIRST", "LAST", "COUNT"],
-            "NUMERIC": [
-                "FIRST",
-                "LAST",
-                "COUNT",
-                "SUM",
-                "AVERAGE",
-                "MIN",
-                "MAX",
-            ],
-            "OBJECT": ["FIRST", "LAST", "COUNT"],
-            # TODO: decide whether to support aggregating lists of lists
-        }
-
-        if field_type_to_aggregate.item_type not in compatible_operators:
+        if field_type_to_aggregate.item_type not in _compatible_aggregation_operators:
             raise Exception(
                 f"cannot aggregate items of type: {json.dumps(field_type_to_aggregate.item_type)}"
             )
 
         # is the operator valid for the type of items in the list?
-        if operator not in compatible_operators[field_type_to_aggregate.item_type]:
+        if (
+            operator
+            not in _compatible_aggregation_operators[field_type_to_aggregate.item_type]
+        ):
             item_type_string = (
                 "EDGE_COLLECTION"
                 if field_type_to_aggregate.item_type == "OBJECT"
@@ -159,8 +114,7 @@ def determine_right_operand_type(
             raise Exception("cannot filter non-list type")
 
         # are left and right comparable by the operator?
-        for i in range(len(operation["filter"]["where"])):
-            comparison = operation["filter"]["where"][i]
+        for comparison in operation["filter"]["where"]:
             operand_types = {}
             for side in ["left", "right"]:
                 operand = comparison[side]
@@ -285,18 +239,18 @@ def type_details_from_scalar(value, expected_type=None):
     if not isinstance(value, list):
         return TypeDetails(
             is_list=False,
-            item_type=utils.field_type_from_python_type_name(type(value).__name__),
+            item_type=utils.field_type_from_python_type(type(value)),
             object_type_ref=None,
         )
 
     item_type = None
     for item in value:
         if item_type is None:
-            item_type = utils.field_type_from_python_type_name(type(item).__name__)
-        elif item_type != utils.field_type_from_python_type_name(type(item).__name__):
+            item_type = utils.field_type_from_python_type(type(item))
+        elif item_type != utils.field_type_from_python_type(type(item)):
             raise Exception("cannot mix types in list")
 
-        if item_type not in valid_list_item_types:
+        if item_type not in valid_list_item_types_set:
             raise Exception(
                 f"list items must be one of the following types: {json.dumps(valid_list_item_types)}"
             )
@@ -313,3 +267,51 @@ def type_details_from_scalar(value, expected_type=None):
         item_type=item_type,
         object_type_ref=None,
     )
+
+
+# {left_operand_type: {right_operand_type: (methods)}}
+_valid_methods = {
+    "STRING": {"STRING": ("CONCAT",)},
+    "NUMERIC": {"NUMERIC": ("ADD", "SUBTRACT", "MULTIPLY", "DIVIDE")},
+    "BOOLEAN": {"BOOLEAN": ("AND", "OR")},
+    "NUMERIC_LIST": {
+        "NUMERIC_LIST": ("CONCAT",),
+        "NUMERIC": ("APPEND", "PREPEND"),
+    },
+    "STRING_LIST": {
+        "STRING_LIST": ("CONCAT",),
+        "STRING": ("APPEND", "PREPEND"),
+    },
+    "BOOLEAN_LIST": {
+        "BOOLEAN_LIST": ("CONCAT",),
+        "BOOLEAN": ("APPEND", "PREPEND"),
+    },
+    "NULL": {
+        "OBJECT": ("SET",),
+        "STRING": ("SET",),
+        "NUMERIC": ("SET",),
+        "BOOLEAN": ("SET",),
+        "STRING_LIST": ("SET",),
+        "NUMERIC_LIST": ("SET",),
+    },
+    "OBJECT": {"OBJECT": ("SET",)},
+    "OBJECT_LIST": {
+        "OBJECT_LIST": ("SET", "CONCAT"),
+        "OBJECT": ("APPEND", "PREPEND"),
+    },
+}
+_compatible_aggregation_operators = {
+    "BOOLEAN": ("AND", "OR", "COUNT"),
+    "STRING": ("FIRST", "LAST", "COUNT"),
+    "NUMERIC": (
+        "FIRST",
+        "LAST",
+        "COUNT",
+        "SUM",
+        "AVERAGE",
+        "MIN",
+        "MAX",
+    ),
+    "OBJECT": ("FIRST", "LAST", "COUNT"),
+    # TODO: decide whether to support aggregating lists of lists
+}
@@ -1,4 +1,13 @@
 class PipelineVariable:
+    __slots__ = (
+        "type_details",
+        "initial",
+        "assigned",
+        "used",
+        "is_loop_variable",
+        "traversal_scopes",
+    )
+
     def __init__(
         self,
         type_details,
@@ -22,13 +22,43 @@ from validation.utils import (
 class SchemaValidator:
     def __init__(self):
         self.schema = None
+        self.reset()
+
+    def reset(self):
+        """Clears the state collected during validation,
+        so that the validator can be reused for another schema.
+        """
+
+        self.errors = []
+        self.warnings = []
+
+        # file names of imported schemas that failed validation or were not used
+        self._import_failures = []
+        self._unused_imports = []
 
         # { action_ref: checkpoint_ref }
         self._action_checkpoint_refs = {}  # to be collected during validation
         # { alias: checkpoint}
         self._checkpoints = {}  # to be collected during validation
         self._psuedo_checkpoints = []  # for implicit action dependencies on threads
-        self._thread_groups = {}
+        self._thread_groups = {}  # {thread_group_ref: ThreadGroup}
+        # actions that are referenced by checkpoint dependencies
+        self._dependee_action_refs = set()
+        # {thread_group_ref: checkpoint_ref}
+        self._thread_group_checkpoint_references = {}
+        self._threaded_action_refs = []  # which actions are threaded?
+        self._unreferenced_thread_groups = []
+        self._unreferenced_checkpoints = []
+
+        self._settable_fields = {}  # {object_promise_ref: [settable_field_name]}
+        # which actions reference each object promise?
+        self._object_promise_actions = {}  # {object_promise_ref: [action_ref]}
+        # which action fulfills each object promise? {object_promise_ref: action_ref}
+        self._object_promise_fulfillment_action_refs = {}
+        # which object promises are fulfilled by more than one action? (not allowed)
+        self._duplicate_object_promise_fulfillments = []  # [object_promise_ref]
+        # {object_promise_ref: thread_group_ref or None}
+        self._object_promise_contexts = {}
 
         # {action_id: Pipeline}
         self._pipelines = {}
@@ -42,12 +72,14 @@ class SchemaValidator:
         # for including helpful context information in error messages
         self._path_context = ""
         self._context_path = None
+        self._object_context = None
 
     def validate(self, schema_dict=None, json_file_path=None, json_string=None):
         if schema_dict is not None:
             self.schema = schema_dict
         elif json_file_path is not None:
-            self.schema = json.load(open(json_file_path))
+            with open(json_file_path) as f:
+                self.schema = json.load(f)
         elif json_string is not None:
             self.schema = json.loads(json_string)
         elif self.schema is None:
@@ -55,10 +87,11 @@ class SchemaValidator:
                 "must provide an argument for schema, json_file_path, or json_string"
             )
 
+        # don't carry over pipelines or cached types from a previous run
+        self.reset()
+
         if isinstance(self.schema, dict):
             self.schema["imported_schemas"] = {}
-            self._import_failures = []
-            self._unused_imports = []
 
             if "imports" in self.schema:
                 self._load_imports_recursive(self.schema)
@@ -67,7 +100,6 @@ class SchemaValidator:
 
             self._collect_actions_and_checkpoints()
 
-        self.warnings = []
         self.errors = (
             self._validate_object("root", self.schema, obj_specs.root_object)
             + self._detect_circular_dependencies()
@@ -313,7 +345,7 @@ class SchemaValidator:
         # Note: "mutually_exclusive" properties are evaluated in _evaluate_meta_properties
         # because they result in obj_spec modifications that affect the validation of other constraints.
         errors = []
-        constraints = obj_spec["constraints"] if "constraints" in obj_spec else {}
+        constraints = obj_spec.get("constraints", {})
         if "forbidden" in constraints:
             for key in constraints["forbidden"]["properties"]:
                 if key in field:
@@ -744,8 +776,11 @@ class SchemaValidator:
         def validate_has_ancestor_recursive(
             checkpoint_ref,
             ancestor_ref,
-            visited_checkpoints=[],
+            visited_checkpoints=None,
         ):
+            if visited_checkpoints is None:
+                visited_checkpoints = set()
+
             if checkpoint_ref is None or checkpoint_ref in visited_checkpoints:
                 return error
 
@@ -753,7 +788,7 @@ class SchemaValidator:
                 # pattern validation will have caught this
                 return []
 
-            visited_checkpoints.append(checkpoint_ref)
+            visited_checkpoints.add(checkpoint_ref)
             checkpoint = self._checkpoints[checkpoint_ref]
 
             check_all_paths = (
@@ -920,8 +955,8 @@ class SchemaValidator:
                     else None
                 )
             else:
-                field_type = utils.field_type_from_python_type_name(
-                    type(operand_object["value"]).__name__
+                field_type = utils.field_type_from_python_type(
+                    type(operand_object["value"])
                 )
                 if field_type == "OBJECT":
                     raise NotImplementedError(
@@ -2344,20 +2379,9 @@ class SchemaValidator:
         if field is None:
             return []
 
-        valid_types = [
-            "string",
-            "decimal",
-            "boolean",
-            "string_list",
-            "numeric_list",
-            "boolean_list",
-        ]
-
-        for scalar_type in valid_types:
+        for validator_name in _scalar_type_validator_names:
             if (
-                getattr(self, "_validate_" + scalar_type)(
-                    path, field, obj_spec, parent_obj_spec
-                )
+                getattr(self, validator_name)(path, field, obj_spec, parent_obj_spec)
                 == []
             ):
                 return []
@@ -2488,18 +2512,12 @@ class SchemaValidator:
                 "unique validation not implemented for type " + str(type(field))
             )
 
-        constraints = obj_spec["constraints"] if "constraints" in obj_spec else {}
-        unique_fields = constraints["unique"] if "unique" in constraints else []
-        unique_composites = (
-            constraints["unique_composites"]
-            if "unique_composites" in constraints
-            else []
-        )
+        constraints = obj_spec.get("constraints", {})
+        unique_fields = constraints.get("unique", [])
+        unique_composites = constraints.get("unique_composites", [])
         constraint_map = {
             "unique": unique_fields + unique_composites,
-            "unique_if_not_null": constraints["unique_if_not_null"]
-            if "unique_if_not_null" in constraints
-            else [],
+            "unique_if_not_null": constraints.get("unique_if_not_null", []),
         }
 
         # { unique_field_name: { field_value: is_unique } }
@@ -2821,11 +2839,11 @@ class SchemaValidator:
                 path_segments_to_resolve[i] = obj_spec_vars[var[1:-1]]
 
             # referenced field from parent object?
-            if re.match(r"^\{\w+\}$", var) and var not in [
+            if re.match(r"^\{\w+\}$", var) and var not in {
                 "{_this}",
                 "{_corresponding_key}",
                 "{_item}",
-            ]:
+            }:
                 path_segments_to_resolve[i] = self._get_field(
                     var[1:-1], self._get_field(path)
                 )
@@ -2996,7 +3014,7 @@ class SchemaValidator:
             if condition["attribute"] == "length":
                 prop = len(prop)
             elif condition["attribute"] == "type":
-                prop = utils.field_type_from_python_type_name(type(prop).__name__)
+                prop = utils.field_type_from_python_type(type(prop))
 
         if operator == "EQUALS":
             return prop == value
@@ -3054,32 +3072,10 @@ class SchemaValidator:
         return to_obj_spec
 
     def _collect_actions_and_checkpoints(self):
-        self._action_checkpoint_refs = {}  # {action_ref: checkpoint_ref}
-        self._checkpoints = {}  # {checkpoint_ref: checkpoint}
+        # the collected state is initialized by reset()
         nested_checkpoint_refs = (
             []
         )  # for validating that all checkpoints are referenced
-        self._dependee_action_refs = (
-            set()
-        )  # actions that are referenced by checkpoint dependencies
-        # {thread_group_ref: checkpoint_ref}
-        self._thread_group_checkpoint_references = {}
-        self._threaded_action_refs = []  # which actions are threaded?
-        self._thread_groups = {}  # {thread_group_ref: ThreadGroup}
-        self._settable_fields = {}  # {object_promise_ref: [settable_field_name]}
-
-        # which actions reference each object promise?
-        self._object_promise_actions = {}  # {object_promise_ref: [action_ref]}
-
-        # which action fulfills each object promise?
-        self._object_promise_fulfillment_action_refs = (
-            {}
-        )  # {object_promise_ref: action_ref}
-        # which object promises are fulfilled by more than one action? (this is not allowed)
-        self._duplicate_object_promise_fulfillments = []  # [object_promise_ref]
-        self._object_promise_contexts = (
-            {}
-        )  # {object_promise_ref: thread_group_ref or None}
 
         schema_ids = [None] + [
             schema_id for schema_id in self.schema["imported_schemas"].keys()
@@ -3090,9 +3086,7 @@ class SchemaValidator:
             if schema is None:
                 continue
 
-            for thread_group in (
-                schema["thread_groups"] if "thread_groups" in schema else []
-            ):
+            for thread_group in schema.get("thread_groups", []):
                 thread_group_id = str(thread_group["id"])
                 thread_group_ref = utils.as_namespaced_ref(
                     schema_id, thread_group["id"], "thread_group"
@@ -3174,7 +3168,7 @@ class SchemaValidator:
                         thread_group_ref
                     ] = self._normalize_ref(thread_group["depends_on"])
 
-            for action in schema["actions"] if "actions" in schema else []:
+            for action in schema.get("actions", []):
                 if "id" not in action:
                     continue
 
@@ -3282,7 +3276,7 @@ class SchemaValidator:
                         else None
                     )
 
-            for checkpoint in schema["checkpoints"] if "checkpoints" in schema else []:
+            for checkpoint in schema.get("checkpoints", []):
                 if "id" not in checkpoint:
                     continue
 
@@ -3320,7 +3314,6 @@ class SchemaValidator:
                                 self._normalize_ref(dependency["checkpoint"])
                             )
 
-        self._unreferenced_thread_groups = []
         for thread_group_ref, thread_group in self._thread_groups.items():
             if (
                 not len(thread_group.action_refs)
@@ -3329,7 +3322,6 @@ class SchemaValidator:
             ):
                 self._unreferenced_thread_groups.append(thread_group_ref)
 
-        self._unreferenced_checkpoints = []
         for checkpoint_ref in self._checkpoints.keys():
             if (
                 checkpoint_ref not in self._action_checkpoint_refs.values()
@@ -3720,13 +3712,12 @@ class SchemaValidator:
                 continue
 
             try:
-                imported_schema = json.load(
-                    open(
-                        os.path.abspath(
-                            os.path.join(dirname, "..", f"schemas/{file_name}.json")
-                        )
+                with open(
+                    os.path.abspath(
+                        os.path.join(dirname, "..", f"schemas/{file_name}.json")
                     )
-                )
+                ) as f:
+                    imported_schema = json.load(f)
 
                 if SchemaValidator().validate(schema_dict=imported_schema) != []:
                     raise Exception("Invalid import")
@@ -4073,3 +4064,16 @@ class SchemaValidator:
             return f"{ref.split('.')[0]}.{new_ref}"
 
         return new_ref
+
+
+_scalar_type_validator_names = tuple(
+    "_validate_" + scalar_type
+    for scalar_type in [
+        "string",
+        "decimal",
+        "boolean",
+        "string_list",
+        "numeric_list",
+        "boolean_list",
+    ]
+)
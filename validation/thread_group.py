@@ -1,4 +1,13 @@
 class ThreadGroup:
+    __slots__ = (
+        "schema_id",
+        "scope",
+        "variables",
+        "sub_thread_group_ids",
+        "action_refs",
+        "checkpoint_refs",
+    )
+
     def __init__(self, schema_id):
         self.schema_id = schema_id
         self.scope = None
@@ -1,6 +1,6 @@
 import re
 from validation import obj_specs, oisql, pipeline_obj_specs, patterns
-from enums import ref_types
+from enums import ref_types_set
 
 
 def is_template_entity_reference(obj, key, entity_obj_name):
@@ -30,7 +30,7 @@ def is_global_ref(value):
 
     alias_match = re.match(patterns.global_ref_alias, ref_id)
     identifier_match = re.match(patterns.global_ref_identifier, ref_id)
-    return ref_type in ref_types and (alias_match or identifier_match)
+    return ref_type in ref_types_set and (alias_match or identifier_match)
 
 
 def is_variable(value):
@@ -71,17 +71,13 @@ def parse_ref_id(value):
 
 
 def as_ref(value, ref_type, value_is_id=False):
-    if ref_type not in ref_types:
+    if ref_type not in ref_types_set:
         raise Exception(f"Invalid ref type: {ref_type}")
 
     if value_is_id:
-        left_brace = ""
-        right_brace = ""
-    else:
-        left_brace = "{"
-        right_brace = "}"
+        return f"{ref_type}:{value}"
 
-    return ref_type + ":" + left_brace + str(value) + right_brace
+    return f"{ref_type}:{{{value}}}"
 
 
 def parse_ref_type(value):
@@ -96,11 +92,11 @@ def parse_ref_type(value):
 
 
 def as_namespaced_ref(schema_id, entity_id, entity_type):
-    ref = f"{entity_type}:{str(entity_id)}"
+    ref = f"{entity_type}:{entity_id}"
     if schema_id is not None:
         # note that imported schemas do not have an "id" field,
         # so the alias reference pattern is always used
-        ref = "schema:{" + schema_id + "}." + ref
+        ref = f"schema:{{{schema_id}}}.{ref}"
     return ref
 
 
@@ -108,7 +104,7 @@ def prepend_schema_id(schema_id, ref):
     if schema_id is not None:
         # note that imported schemas do not have an "id" field,
         # so the alias reference pattern is always used
-        return "schema:{" + schema_id + "}." + ref
+        return f"schema:{{{schema_id}}}.{ref}"
     return ref
 
 
@@ -187,22 +183,12 @@ def get_obj_spec(obj_spec_name):
     raise Exception(f"obj_spec not found: {obj_spec_name}")
 
 
-def field_type_from_python_type_name(python_type_name):
-    type_map = {
-        "str": "STRING",
-        "int": "NUMERIC",
-        "float": "NUMERIC",
-        "bool": "BOOLEAN",
-        "list": "LIST",
-        "dict": "OBJECT",
-        "NoneType": "NULL",
-    }
-
-    if python_type_name in type_map:
-        return type_map[python_type_name]
+def field_type_from_python_type(python_type):
+    if python_type in _python_type_field_types:
+        return _python_type_field_types[python_type]
 
     raise NotImplementedError(
-        f"Field type not found for python type: {python_type_name}"
+        f"Field type not found for python type: {python_type.__name__}"
     )
 
 
@@ -216,78 +202,89 @@ def types_are_comparable(left_type, right_type, operator):
     elif right_type is not None and right_type.endswith("_LIST") and left_type == "LIST":
         left_type = right_type
 
-    # {left_types: {valid_operators: valid_right_type}}
-    valid_comparisons = {
-        "STRING": {
-            "EQUALS": "STRING",
-            "DOES_NOT_EQUAL": "STRING",
-            "CONTAINS": "STRING",
-            "DOES_NOT_CONTAIN": "STRING",
-            "ONE_OF": "STRING_LIST",
-            "NONE_OF": "STRING_LIST",
-        },
-        "NUMERIC": {
-            "EQUALS": "NUMERIC",
-            "DOES_NOT_EQUAL": "NUMERIC",
-            "GREATER_THAN": "NUMERIC",
-            "LESS_THAN": "NUMERIC",
-            "GREATER_THAN_OR_EQUAL_TO": "NUMERIC",
-            "LESS_THAN_OR_EQUAL_TO": "NUMERIC",
-            "ONE_OF": "NUMERIC_LIST",
-            "NONE_OF": "NUMERIC_LIST",
-        },
-        "BOOLEAN": {
-            "EQUALS": "BOOLEAN",
-            "DOES_NOT_EQUAL": "BOOLEAN",
-        },
-        "STRING_LIST": {
-            "CONTAINS": "STRING",
-            "DOES_NOT_CONTAIN": "STRING",
-            "EQUALS": "STRING_LIST",
-            "DOES_NOT_EQUAL": "STRING_LIST",
-            "CONTAINS_ANY_OF": "STRING_LIST",
-            "IS_SUBSET_OF": "STRING_LIST",
-            "IS_SUPERSET_OF": "STRING_LIST",
-            "CONTAINS_NONE_OF": "STRING_LIST",
-        },
-        "NUMERIC_LIST": {
-            "CONTAINS": "NUMERIC",
-            "DOES_NOT_CONTAIN": "NUMERIC",
-            "EQUALS": "NUMERIC_LIST",
-            "DOES_NOT_EQUAL": "NUMERIC_LIST",
-            "CONTAINS_ANY_OF": "NUMERIC_LIST",
-            "IS_SUBSET_OF": "NUMERIC_LIST",
-            "IS_SUPERSET_OF": "NUMERIC_LIST",
-            "CONTAINS_NONE_OF": "NUMERIC_LIST",
-        },
-        "BOOLEAN_LIST": {
-            "CONTAINS": "BOOLEAN",
-            "DOES_NOT_CONTAIN": "BOOLEAN",
-            "EQUALS": "BOOLEAN_LIST",
-            "DOES_NOT_EQUAL": "BOOLEAN_LIST",
-            "IS_SUBSET_OF": "BOOLEAN_LIST",
-            "IS_SUPERSET_OF": "BOOLEAN_LIST",
-        },
-        "OBJECT": {
-            "EQUALS": "OBJECT",
-            "DOES_NOT_EQUAL": "OBJECT",
-            "ONE_OF": "OBJECT_LIST",
-            "NONE_OF": "OBJECT_LIST",
-        },
-        "OBJECT_LIST": {
-            "CONTAINS": "OBJECT",
-            "DOES_NOT_CONTAIN": "OBJECT",
-            "EQUALS": "OBJECT_LIST",
-            "DOES_NOT_EQUAL": "OBJECT_LIST",
-            "CONTAINS_ANY_OF": "OBJECT_LIST",
-            "IS_SUBSET_OF": "OBJECT_LIST",
-            "IS_SUPERSET_OF": "OBJECT_LIST",
-            "CONTAINS_NONE_OF": "OBJECT_LIST",
-        },
-    }
-
     return (
-        left_type in valid_comparisons
-        and operator in valid_comparisons[left_type]
-        and right_type == valid_comparisons[left_type][operator]
+        left_type in _valid_comparisons
+        and operator in _valid_comparisons[left_type]
+        and right_type == _valid_comparisons[left_type][operator]
     )
+
+
+_python_type_field_types = {
+    str: "STRING",
+    int: "NUMERIC",
+    float: "NUMERIC",
+    bool: "BOOLEAN",
+    list: "LIST",
+    dict: "OBJECT",
+    type(None): "NULL",
+}
+
+# {left_types: {valid_operators: valid_right_type}}
+_valid_comparisons = {
+    "STRING": {
+        "EQUALS": "STRING",
+        "DOES_NOT_EQUAL": "STRING",
+        "CONTAINS": "STRING",
+        "DOES_NOT_CONTAIN": "STRING",
+        "ONE_OF": "STRING_LIST",
+        "NONE_OF": "STRING_LIST",
+    },
+    "NUMERIC": {
+        "EQUALS": "NUMERIC",
+        "DOES_NOT_EQUAL": "NUMERIC",
+        "GREATER_THAN": "NUMERIC",
+        "LESS_THAN": "NUMERIC",
+        "GREATER_THAN_OR_EQUAL_TO": "NUMERIC",
+        "LESS_THAN_OR_EQUAL_TO": "NUMERIC",
+        "ONE_OF": "NUMERIC_LIST",
+        "NONE_OF": "NUMERIC_LIST",
+    },
+    "BOOLEAN": {
+        "EQUALS": "BOOLEAN",
+        "DOES_NOT_EQUAL": "BOOLEAN",
+    },
+    "STRING_LIST": {
+        "CONTAINS": "STRING",
+        "DOES_NOT_CONTAIN": "STRING",
+        "EQUALS": "STRING_LIST",
+        "DOES_NOT_EQUAL": "STRING_LIST",
+        "CONTAINS_ANY_OF": "STRING_LIST",
+        "IS_SUBSET_OF": "STRING_LIST",
+        "IS_SUPERSET_OF": "STRING_LIST",
+        "CONTAINS_NONE_OF": "STRING_LIST",
+    },
+    "NUMERIC_LIST": {
+        "CONTAINS": "NUMERIC",
+        "DOES_NOT_CONTAIN": "NUMERIC",
+        "EQUALS": "NUMERIC_LIST",
+        "DOES_NOT_EQUAL": "NUMERIC_LIST",
+        "CONTAINS_ANY_OF": "NUMERIC_LIST",
+        "IS_SUBSET_OF": "NUMERIC_LIST",
+        "IS_SUPERSET_OF": "NUMERIC_LIST",
+        "CONTAINS_NONE_OF": "NUMERIC_LIST",
+    },
+    "BOOLEAN_LIST": {
+        "CONTAINS": "BOOLEAN",
+        "DOES_NOT_CONTAIN": "BOOLEAN",
+        "EQUALS": "BOOLEAN_LIST",
+        "DOES_NOT_EQUAL": "BOOLEAN_LIST",
+        "IS_SUBSET_OF": "BOOLEAN_LIST",
+        "IS_SUPERSET_OF": "BOOLEAN_LIST",
+    },
+    "OBJECT": {
+        "EQUALS": "OBJECT",
+        "DOES_NOT_EQUAL": "OBJECT",
+        "ONE_OF": "OBJECT_LIST",
+        "NONE_OF": "OBJECT_LIST",
+    },
+    "OBJECT_LIST": {
+        "CONTAINS": "OBJECT",
+        "DOES_NOT_CONTAIN": "OBJECT",
+        "EQUALS": "OBJECT_LIST",
+        "DOES_NOT_EQUAL": "OBJECT_LIST",
+        "CONTAINS_ANY_OF": "OBJECT_LIST",
+        "IS_SUBSET_OF": "OBJECT_LIST",
+        "IS_SUPERSET_OF": "OBJECT_LIST",
+        "CONTAINS_NONE_OF": "OBJECT_LIST",
+    },
+}
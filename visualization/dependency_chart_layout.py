@@ -1,10 +1,13 @@
+from collections import defaultdict
+
+
 class DependencyChartLayout:
     def __init__(self, node_height=2, node_spacing=1):
         self.node_depths = {}
 
         self._apply_depth_offsets = False
         self.depth_origins = {}
-        self.depth_offset_directives = {}
+        self.depth_offset_directives = defaultdict(list)
         self.depth_offsets = {}
 
         self.node_height = node_height
@@ -79,9 +82,8 @@ class DependencyChartLayout:
         # it may be necessary to apply depth offsets to nodes whose depths were
         # initially calculated relative to a non-rightmost exit node.
         self.depth_origins = {}  # from which origin was each depth calculated?
-        self.depth_offset_directives = (
-            {}
-        )  # which origins directed offsets for other origins?
+        # which origins directed offsets for other origins?
+        self.depth_offset_directives = defaultdict(list)
         self.depth_offsets = {}  # how much does each node's depth need to be adjusted?
 
         # calculate the depth of each node, with depth 0 being the rightmost exit node
@@ -89,7 +91,7 @@ class DependencyChartLayout:
             self.node_depths[exit_node] = 0  # assume rightmost until proven otherwise
             self.depth_origins[exit_node] = exit_node
 
-            self._calculate_node_depths_recursive(
+            self._calculate_node_depths_from(
                 node_id=exit_node, edge_dict=edge_dict, depth=0, origin=exit_node
             )
 
@@ -100,27 +102,32 @@ class DependencyChartLayout:
                     if self.depth_origins[node_id] == origin:
                         self.node_depths[node_id] += offset
 
-    def _calculate_node_depths_recursive(self, node_id, edge_dict, depth, origin):
-        if node_id in edge_dict:
-            depth += 1
-            for edge_node in edge_dict[node_id]:
-                set_depth_and_recurse = False
+    def _calculate_node_depths_from(self, node_id, edge_dict, depth, origin):
+        if node_id not in edge_dict:
+            return
+
+        # Depth-first traversal with an explicit stack of (node, depth, edge iterator),
+        # so that long dependency chains cannot exceed the recursion limit.
+        # Nodes on the current path are tracked to detect cycles.
+        stack = [(node_id, depth + 1, iter(edge_dict[node_id]))]
+        path = {node_id}
+        while stack:
+            _, depth, edge_nodes = stack[-1]
+            for edge_node in edge_nodes:
+                set_depth_and_descend = False
 
                 if edge_node not in self.node_depths:
                     # first time this node has been reached
-                    set_depth_and_recurse = True
+                    set_depth_and_descend = True
                 elif self.node_depths[edge_node] < depth:
                     # longer path discovered
-                    set_depth_and_recurse = True
+                    set_depth_and_descend = True
 
                     if self._apply_depth_offsets:
                         # depth adjustment required for former origin
                         former_origin = self.depth_origins[edge_node]
                         if former_origin != origin:
                             # depth adjustment must cascade to all nodes with the same depth origin
-                            if origin not in self.depth_offset_directives:
-                                self.depth_offset_directives[origin] = []
-
                             self.depth_offset_directives[origin].append(former_origin)
                             adjustment = depth - self.node_depths[edge_node]
                             self.depth_offsets[former_origin] = adjustment
@@ -140,13 +147,22 @@ class DependencyChartLayout:
                 # elif self.node_depths[edge_node] > depth:
                 # TODO: shorter path discovered -- depth adjustment required for current origin
 
-                if set_depth_and_recurse:
+                if set_depth_and_descend:
+                    if edge_node in path:
+                        raise Exception(
+                            f"Cannot calculate node depths: cyclic dependency detected at node {edge_node}"
+                        )
+
                     self.node_depths[edge_node] = depth
                     self.depth_origins[edge_node] = origin
 
-                    self._calculate_node_depths_recursive(
-                        edge_node, edge_dict, depth, origin
-                    )
+                    if edge_node in edge_dict:
+                        # descend, then resume this node's remaining edges afterwards
+                        stack.append((edge_node, depth + 1, iter(edge_dict[edge_node])))
+                        path.add(edge_node)
+                        break
+            else:
+                path.remove(stack.pop()[0])
 
     def _sort_column_by_dependents(self, column, sorted_columns, edge_dict):
         """Assign scores to pull each node up or down toward its dependents
@@ -158,7 +174,7 @@ class DependencyChartLayout:
 
         score = {node_id: 0 for node_id in column}
 
-        not_weighted = column.copy()
+        not_weighted = set(column)
         column_idx = len(sorted_columns) - 1
         while not_weighted and column_idx >= 0:
             for dependent_id in sorted_columns[column_idx]:
@@ -206,9 +222,7 @@ class DependencyChartLayout:
         return False
 
     def _find_exit_nodes(self, node_ids, edge_tuples):
-        exit_nodes = []
-        for node_id in node_ids:
-            if node_id not in [b for (_, b) in edge_tuples]:
-                exit_nodes.append(node_id)
+        # collect edge destinations in one pass rather than once per node
+        dependency_ids = {b for (_, b) in edge_tuples}
 
-        return exit_nodes
+        return [node_id for node_id in node_ids if node_id not in dependency_ids]
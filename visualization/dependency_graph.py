@@ -1,5 +1,6 @@
 import networkx as nx
 import json
+from collections import Counter, defaultdict
 from utils import hash_sorted_object
 from validation.schema_validator import SchemaValidator
 from validation.utils import parse_ref_id
@@ -14,7 +15,8 @@ class DependencyGraph:
         if schema_dict is not None:
             self.schema = schema_dict
         elif json_schema_file_path is not None:
-            self.schema = json.load(open(json_schema_file_path))
+            with open(json_schema_file_path) as f:
+                self.schema = json.load(f)
         else:
             raise Exception(
                 "must provide an argument for schema_dict or json_schema_file_path"
@@ -31,11 +33,10 @@ class DependencyGraph:
         self.checkpoints = []
         self.gates = {}
         self.edge_tuples = []
-        self.edge_dict = {}
+        self.edge_dict = defaultdict(list)
         self.edge_captions = {}
-        self.dependency_hashes = (
-            {}
-        )  # this is used to prevent duplicate dependencies from being added to a gate
+        # this is used to prevent duplicate dependencies from being added to a gate
+        self.dependency_hashes = defaultdict(set)
 
         self.layout_algorithm = "dependency_chart"
         self.node_height = 2
@@ -56,12 +57,10 @@ class DependencyGraph:
         self._default_node_color = "#ffffff"
         self.party_colors = {}
         if "parties" in self.schema:
-            for party in self.schema["parties"]:
-                self.party_colors[party["name"]] = (
-                    party["hex_code"]
-                    if "hex_code" in party
-                    else self._default_node_color
-                )
+            self.party_colors = {
+                party["name"]: party.get("hex_code", self._default_node_color)
+                for party in self.schema["parties"]
+            }
 
         self._json_schema_to_graph()
 
@@ -73,7 +72,7 @@ class DependencyGraph:
 
         self.edge_tuples = []
         self.gates = {}
-        self.dependency_hashes = {}
+        self.dependency_hashes = defaultdict(set)
 
         for action_id, action in self.actions.items():
             if "depends_on" not in action:
@@ -86,22 +85,11 @@ class DependencyGraph:
         self._set_node_coordinates()
 
     def _explore_edges_recursive(self, dependent_id, checkpoint_alias):
-        def is_duplicate_dependency(dependent_id, dependency_obj):
-            if dependent_id not in self.dependency_hashes:
-                self.dependency_hashes[dependent_id] = []
-
-            dependency_hash = hash_sorted_object(dependency_obj)
-            if dependency_hash in self.dependency_hashes[dependent_id]:
-                return True
-
-            self.dependency_hashes[dependent_id].append(dependency_hash)
-            return False
-
         checkpoint = self.checkpoints[checkpoint_alias]
         num_dependencies = len(checkpoint["dependencies"])
 
         if num_dependencies > 1:
-            if is_duplicate_dependency(dependent_id, checkpoint):
+            if self._is_duplicate_dependency(dependent_id, checkpoint):
                 return
 
             # represent the checkpoint as a node
@@ -111,29 +99,26 @@ class DependencyGraph:
             )
             self.gates[checkpoint_alias] = checkpoint["gate_type"]
 
-            if checkpoint_alias not in self.dependency_hashes:
-                self.dependency_hashes[checkpoint_alias] = []
-
             # connect the gate to the nodes it depends on
             for dep in checkpoint["dependencies"]:
                 # checkpoints can contain standalone dependencies and checkpoint references
                 if "compare" in dep:
-                    if is_duplicate_dependency(checkpoint_alias, dep):
+                    if self._is_duplicate_dependency(checkpoint_alias, dep):
                         continue
 
+                    comparison = dep["compare"]
                     for operand in ["left", "right"]:
                         if (
-                            operand not in dep["compare"]
-                            or "ref" not in dep["compare"][operand]
+                            operand not in comparison
+                            or "ref" not in comparison[operand]
                         ):
                             continue
 
-                        if "ref" in dep["compare"][operand]:
-                            self._add_edge(
-                                checkpoint_alias,
-                                parse_ref_id(dep["compare"][operand]["ref"]),
-                                action_dependency=dep["compare"],
-                            )
+                        self._add_edge(
+                            checkpoint_alias,
+                            parse_ref_id(comparison[operand]["ref"]),
+                            action_dependency=comparison,
+                        )
                 elif "checkpoint" in dep:
                     self._explore_edges_recursive(
                         checkpoint_alias, parse_ref_id(dep["checkpoint"])
@@ -144,22 +129,16 @@ class DependencyGraph:
             dependency = checkpoint["dependencies"][0]
 
             # prevent edge duplication for identical dependencies
-            if is_duplicate_dependency(dependent_id, dependency):
+            if self._is_duplicate_dependency(dependent_id, dependency):
                 return
 
+            comparison = dependency["compare"]
             for operand in ["left", "right"]:
-                if (
-                    operand not in dependency["compare"]
-                    or "ref" not in dependency["compare"][operand]
-                ):
+                if operand not in comparison or "ref" not in comparison[operand]:
                     continue
 
-                if "ref" in dependency["compare"][operand]:
-                    to_action_id = parse_ref_id(dependency["compare"][operand]["ref"])
-
-                self._add_edge(
-                    dependent_id, to_action_id, action_dependency=dependency["compare"]
-                )
+                to_action_id = parse_ref_id(comparison[operand]["ref"])
+                self._add_edge(dependent_id, to_action_id, action_dependency=comparison)
 
                 action = self.actions[to_action_id]
                 if "depends_on" in action:
@@ -167,6 +146,14 @@ class DependencyGraph:
                         to_action_id, parse_ref_id(action["depends_on"])
                     )
 
+    def _is_duplicate_dependency(self, dependent_id, dependency_obj):
+        dependency_hash = hash_sorted_object(dependency_obj)
+        if dependency_hash in self.dependency_hashes[dependent_id]:
+            return True
+
+        self.dependency_hashes[dependent_id].add(dependency_hash)
+        return False
+
     def generate_miro_board(self, board_id=None, board_name=None):
         mb = MiroBoard(board_id)
 
@@ -182,75 +169,100 @@ class DependencyGraph:
         self._generate_miro_connectors(mb, shape_dict)
 
     def _generate_miro_shapes(self, mb):
-        def create_supporting_info_shape(supporting_info, x, y):
-            mb.create_shape(
-                shape_type=shape_types["SUPPORTING_INFO"],
-                content="- " + "<br/>- ".join(supporting_info),
-                text_align="left",
-                fill_color="#D0E78C",
-                x=x + self.node_spacing * self.x_coord_factor / 5,
-                y=y - self.node_height * self.y_coord_factor / 2,
+        # Shapes are created in one concurrent batch; shape_keys records which
+        # node each spec belongs to (None for supporting info shapes).
+        shape_keys = []
+        shape_specs = []
+
+        def add_supporting_info_shape(supporting_info, x, y):
+            shape_keys.append(None)
+            shape_specs.append(
+                {
+                    "shape_type": shape_types["SUPPORTING_INFO"],
+                    "content": "- " + "<br/>- ".join(supporting_info),
+                    "text_align": "left",
+                    "fill_color": "#D0E78C",
+                    "x": x + self.node_spacing * self.x_coord_factor / 5,
+                    "y": y - self.node_height * self.y_coord_factor / 2,
+                }
             )
 
-        shape_dict = {}
-
         for action_id, node in self.actions.items():
-            x = self.node_coordinates[action_id][0] * self.x_coord_factor
-            y = self.node_coordinates[action_id][1] * self.y_coord_factor
-
-            shape_dict[action_id] = mb.create_shape(
-                shape_type=shape_types["ACTION"],
-                content=node["description"] if "description" in node else node["id"],
-                fill_color=self.party_colors[parse_ref_id(node["party"])]
-                if "party" in node
-                else self._default_node_color,
-                x=x,
-                y=y,
+            node_x, node_y = self.node_coordinates[action_id]
+            x = node_x * self.x_coord_factor
+            y = node_y * self.y_coord_factor
+
+            shape_keys.append(action_id)
+            shape_specs.append(
+                {
+                    "shape_type": shape_types["ACTION"],
+                    "content": (
+                        node["description"] if "description" in node else node["id"]
+                    ),
+                    "fill_color": (
+                        self.party_colors[parse_ref_id(node["party"])]
+                        if "party" in node
+                        else self._default_node_color
+                    ),
+                    "x": x,
+                    "y": y,
+                }
             )
 
             if "supporting_info" in node:
-                create_supporting_info_shape(node["supporting_info"], x, y)
+                add_supporting_info_shape(node["supporting_info"], x, y)
 
         for alias, gate_type in self.gates.items():
-            x = self.node_coordinates[alias][0] * self.x_coord_factor
-            y = self.node_coordinates[alias][1] * self.y_coord_factor
-
-            shape_dict[alias] = mb.create_shape(
-                shape_type=shape_types["GATE"],
-                content=gate_type,
-                fill_color=gate_colors[gate_type],
-                x=x,
-                y=y,
+            node_x, node_y = self.node_coordinates[alias]
+            x = node_x * self.x_coord_factor
+            y = node_y * self.y_coord_factor
+
+            shape_keys.append(alias)
+            shape_specs.append(
+                {
+                    "shape_type": shape_types["GATE"],
+                    "content": gate_type,
+                    "fill_color": gate_colors[gate_type],
+                    "x": x,
+                    "y": y,
+                }
             )
 
             if "supporting_info" in self.checkpoints[alias]:
-                create_supporting_info_shape(
+                add_supporting_info_shape(
                     self.checkpoints[alias]["supporting_info"], x, y
                 )
 
-        return shape_dict
+        shape_ids = mb.create_shapes(shape_specs)
+
+        return {
+            key: shape_id
+            for key, shape_id in zip(shape_keys, shape_ids)
+            if key is not None
+        }
 
     def _generate_miro_connectors(self, mb, shape_dict):
         # If there are multiple connectors between two shapes, they need to be spaced out
-        tuple_occurences = {}
-        for from_id, to_id in self.edge_tuples:
-            if (from_id, to_id) not in tuple_occurences:
-                tuple_occurences[(from_id, to_id)] = 0
-            tuple_occurences[(from_id, to_id)] += 1
-
-        for from_id, to_id in self.edge_tuples:
-            if tuple_occurences[(from_id, to_id)] == 1:
-                mb.create_connector(
-                    shape_dict[from_id],
-                    shape_dict[to_id],
-                    caption=self.edge_captions[(from_id, to_id)][0]
-                    if (from_id, to_id) in self.edge_captions
-                    and len(self.edge_captions[(from_id, to_id)]) == 1
-                    else None,
+        tuple_occurences = Counter(self.edge_tuples)
+
+        connector_specs = []
+        elbow_specs = []
+        # (from_shape_id, to_shape_id, caption, strand index) for each elbow
+        elbow_strands = []
+        for edge_tuple in self.edge_tuples:
+            from_id, to_id = edge_tuple
+            captions = self.edge_captions.get(edge_tuple, [])
+            if tuple_occurences[edge_tuple] == 1:
+                connector_specs.append(
+                    {
+                        "from_id": shape_dict[from_id],
+                        "to_id": shape_dict[to_id],
+                        "caption": captions[0] if len(captions) == 1 else None,
+                    }
                 )
             else:
                 # "elbow" shapes are needed to space out the multiple connectors
-                num_strands = tuple_occurences[(from_id, to_id)]
+                num_strands = tuple_occurences[edge_tuple]
 
                 elbow_x = (
                     self.node_coordinates[from_id][0] + self.node_coordinates[to_id][0]
@@ -263,32 +275,43 @@ class DependencyGraph:
                 ) / 2
                 elbow_y = y_center - (column_height / 2)
                 for i in range(num_strands):
-                    elbow_id = mb.create_invisible_shape(
-                        x=elbow_x * self.x_coord_factor,
-                        y=elbow_y * self.y_coord_factor,
+                    elbow_specs.append(
+                        {
+                            "x": elbow_x * self.x_coord_factor,
+                            "y": elbow_y * self.y_coord_factor,
+                        }
                     )
                     elbow_y += self.strand_spacing
 
-                    caption = (
-                        self.edge_captions[(from_id, to_id)][i]
-                        if (from_id, to_id) in self.edge_captions
-                        and len(self.edge_captions[(from_id, to_id)]) > i
-                        else None
+                    caption = captions[i] if len(captions) > i else None
+                    elbow_strands.append(
+                        (shape_dict[from_id], shape_dict[to_id], caption, i)
                     )
 
-                    # Connect the gate and node through the elbow
-                    # using two connector segments
-                    mb.create_connector(
-                        shape_dict[from_id],
-                        elbow_id,
-                        end_stroke_cap="none",
-                        caption=caption if i % 2 == 0 else None,
-                    )
-                    mb.create_connector(
-                        elbow_id,
-                        shape_dict[to_id],
-                        caption=caption if i % 2 == 1 else None,
-                    )
+        # the elbows must exist before they can be connected
+        elbow_ids = mb.create_invisible_shapes(elbow_specs)
+        for elbow_id, (from_shape_id, to_shape_id, caption, i) in zip(
+            elbow_ids, elbow_strands
+        ):
+            # Connect the gate and node through the elbow
+            # using two connector segments
+            connector_specs.append(
+                {
+                    "from_id": from_shape_id,
+                    "to_id": elbow_id,
+                    "end_stroke_cap": "none",
+                    "caption": caption if i % 2 == 0 else None,
+                }
+            )
+            connector_specs.append(
+                {
+                    "from_id": elbow_id,
+                    "to_id": to_shape_id,
+                    "caption": caption if i % 2 == 1 else None,
+                }
+            )
+
+        mb.create_connectors(connector_specs)
 
     def _add_edge(
         self,
@@ -297,9 +320,6 @@ class DependencyGraph:
         action_dependency=None,
         checkpoint_dependency=None,
     ):
-        if from_action_id not in self.edge_dict:
-            self.edge_dict[from_action_id] = []
-
         self.edge_dict[from_action_id].append(to_action_id)
         edge_tuple = (from_action_id, to_action_id)
         self.edge_tuples.append(edge_tuple)